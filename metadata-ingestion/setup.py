@@ -192,6 +192,8 @@ snowflake_common = {
     "snowflake-sqlalchemy>=1.4.3",
     # See https://github.com/snowflakedb/snowflake-connector-python/pull/1348 for why 2.8.2 is blocked
     "snowflake-connector-python!=2.8.2",
+    # Used to decode the access history JSON payloads.
+    "orjson",
     "pandas",
     "cryptography",
     "msal",
@@ -1,3 +1,4 @@
+import functools
 import re
 import unittest.mock
 from abc import ABC, abstractmethod
@@ -212,6 +213,13 @@ class ConfigurationMechanism(ABC):
         pass
 
 
+@functools.lru_cache(maxsize=1000)
+def _compile_pattern(pattern: str, flags: int) -> re.Pattern:
+    # Keyed on the pattern contents rather than the AllowDenyPattern instance, since
+    # the allow/deny lists are occasionally mutated after the config is parsed.
+    return re.compile(pattern, flags)
+
+
 class AllowDenyPattern(ConfigModel):
     """A class to store allow deny regexes"""
 
@@ -243,12 +251,15 @@ class AllowDenyPattern(ConfigModel):
         return AllowDenyPattern()
 
     def allowed(self, string: str) -> bool:
+        # Patterns are compiled lazily, so that an invalid pattern after the first
+        # match is never reached, just like with re.match.
+        regex_flags = self.regex_flags
         for deny_pattern in self.deny:
-            if re.match(deny_pattern, string, self.regex_flags):
+            if _compile_pattern(deny_pattern, regex_flags).match(string):
                 return False
 
         return any(
-            re.match(allow_pattern, string, self.regex_flags)
+            _compile_pattern(allow_pattern, regex_flags).match(string)
             for allow_pattern in self.allow
         )
 
@@ -1,9 +1,26 @@
-import json
+import collections
+import concurrent.futures
+import itertools
 import logging
+import multiprocessing
+import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Collection, Iterable, List, Optional, Set, Tuple, Type
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
+import orjson
 from pydantic import BaseModel, validator
 from snowflake.connector import SnowflakeConnection
 
@@ -44,11 +61,28 @@ EXTERNAL_LINEAGE = "external_lineage"
 TABLE_LINEAGE = "table_lineage"
 VIEW_LINEAGE = "view_lineage"
 
+_LINEAGE_PARSE_BATCH_SIZE = 2000
+
+
+def _get_lineage_parse_workers() -> int:
+    # Parsing the access history rows is CPU-bound, so it can optionally be
+    # spread across processes. Disabled (0 or 1) by default.
+    value = os.getenv("DATAHUB_SNOWFLAKE_LINEAGE_PARSE_WORKERS")
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(
+            f"Ignoring invalid DATAHUB_SNOWFLAKE_LINEAGE_PARSE_WORKERS={value!r}"
+        )
+        return 0
+
 
 def pydantic_parse_json(field: str) -> classmethod:
     def _parse_from_json(cls: Type, v: Any) -> dict:
         if isinstance(v, str):
-            return json.loads(v)
+            return orjson.loads(v)
         return v
 
     return validator(field, pre=True, allow_reuse=True)(_parse_from_json)
@@ -94,6 +128,33 @@ class UpstreamLineageEdge(BaseModel):
     _json_queries = pydantic_parse_json("QUERIES")
 
 
+def _parse_upstream_lineage_rows(rows: List[dict]) -> List[UpstreamLineageEdge]:
+    return [UpstreamLineageEdge.parse_obj(row) for row in rows]
+
+
+def _parse_upstream_lineage_rows_in_parallel(
+    rows: Iterable[dict], max_workers: int
+) -> Iterable[UpstreamLineageEdge]:
+    rows_iter = iter(rows)
+    # The connector's prefetch threads are running while the workers start, and
+    # forking a multi-threaded process can deadlock the children.
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        # Bound the number of in-flight batches so we don't pull the whole
+        # result set into memory, while still preserving the row order.
+        pending: Deque[concurrent.futures.Future] = collections.deque()
+        while True:
+            while len(pending) < 2 * max_workers:
+                batch = list(itertools.islice(rows_iter, _LINEAGE_PARSE_BATCH_SIZE))
+                if not batch:
+                    break
+                pending.append(executor.submit(_parse_upstream_lineage_rows, batch))
+            if not pending:
+                break
+            yield from pending.popleft().result()
+
+
 @dataclass(frozen=True)
 class SnowflakeColumnId:
     column_name: str
@@ -131,6 +192,10 @@ class SnowflakeLineageExtractor(
         self.connection: Optional[SnowflakeConnection] = None
         self.sql_aggregator = sql_aggregator
 
+        # Map of qualified upstream object name -> dataset urn. The same upstream
+        # shows up once for every downstream column that depends on it.
+        self._upstream_urns: Dict[str, str] = {}
+
         self.redundant_run_skip_handler = redundant_run_skip_handler
         self.start_time, self.end_time = (
             self.report.lineage_start_time,
@@ -198,11 +263,9 @@ class SnowflakeLineageExtractor(
             )  # See Edition Note above for why
         else:
             with PerfTimer() as timer:
+                # Rows are streamed from the cursor straight into the aggregator,
+                # without materializing the full result set first.
                 results = self._fetch_upstream_lineages_for_tables()
-
-                if not results:
-                    return
-
                 self.populate_known_query_lineage(discovered_tables, results)
                 self.report.table_lineage_query_secs = timer.elapsed_seconds()
             logger.info(
@@ -349,7 +412,7 @@ class SnowflakeLineageExtractor(
             return
 
         if db_row["UPSTREAM_LOCATIONS"] is not None:
-            external_locations = json.loads(db_row["UPSTREAM_LOCATIONS"])
+            external_locations = orjson.loads(db_row["UPSTREAM_LOCATIONS"])
 
             for loc in external_locations:
                 if loc.startswith("s3://"):
@@ -367,9 +430,15 @@ class SnowflakeLineageExtractor(
             include_view_lineage=self.config.include_view_lineage,
             include_column_lineage=self.config.include_column_lineage,
         )
+        parse_workers = _get_lineage_parse_workers()
         try:
-            for db_row in self.query(query):
-                yield UpstreamLineageEdge.parse_obj(db_row)
+            if parse_workers > 1:
+                yield from _parse_upstream_lineage_rows_in_parallel(
+                    self.query(query), max_workers=parse_workers
+                )
+            else:
+                for db_row in self.query(query):
+                    yield UpstreamLineageEdge.parse_obj(db_row)
         except Exception as e:
             if isinstance(e, SnowflakePermissionError):
                 error_msg = "Failed to get table/view to table lineage. Please grant imported privileges on SNOWFLAKE database. "
@@ -474,6 +543,7 @@ class SnowflakeLineageExtractor(
         self, upstream_columms: Set[SnowflakeColumnId]
     ) -> List[ColumnRef]:
         column_upstreams = []
+        snowflake_identifier = self.snowflake_identifier
         for upstream_col in upstream_columms:
             if (
                 upstream_col.object_name
@@ -484,17 +554,23 @@ class SnowflakeLineageExtractor(
                     is_upstream=True,
                 )
             ):
-                upstream_dataset_name = self.get_dataset_identifier_from_qualified_name(
-                    upstream_col.object_name
-                )
                 column_upstreams.append(
                     ColumnRef(
-                        table=self.dataset_urn_builder(upstream_dataset_name),
-                        column=self.snowflake_identifier(upstream_col.column_name),
+                        table=self._get_upstream_urn(upstream_col.object_name),
+                        column=snowflake_identifier(upstream_col.column_name),
                     )
                 )
         return column_upstreams
 
+    def _get_upstream_urn(self, qualified_name: str) -> str:
+        urn = self._upstream_urns.get(qualified_name)
+        if urn is None:
+            urn = self.dataset_urn_builder(
+                self.get_dataset_identifier_from_qualified_name(qualified_name)
+            )
+            self._upstream_urns[qualified_name] = urn
+        return urn
+
     def get_external_upstreams(self, external_lineage: Set[str]) -> List[UpstreamClass]:
         external_upstreams = []
         for external_lineage_entry in sorted(external_lineage):
@@ -308,7 +308,7 @@ class SnowflakeQuery:
         return f"""
         SELECT
             -- access_history.query_id, -- only for debugging purposes
-            access_history.query_start_time AS "QUERY_START_TIME",
+            CONVERT_TIMEZONE('UTC', access_history.query_start_time) AS "QUERY_START_TIME",
             query_history.query_text AS "QUERY_TEXT",
             query_history.query_type AS "QUERY_TYPE",
             query_history.rows_inserted AS "ROWS_INSERTED",
@@ -816,6 +816,7 @@ class SnowflakeQuery:
             WHERE
                 upstream_column_name is not null
                 and upstream_column_table_name is not null
+                and upstream_column_object_domain::varchar in {SnowflakeQuery.ACCESS_HISTORY_TABLE_VIEW_DOMAINS_FILTER}
             GROUP BY
                 downstream_table_name,
                 downstream_column_name,
@@ -1,9 +1,9 @@
-import json
 import logging
 import time
 from datetime import datetime, timezone
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import orjson
 import pydantic
 from snowflake.connector import SnowflakeConnection
 
@@ -65,6 +65,10 @@ OPERATION_STATEMENT_TYPES = {
 }
 
 
+_UNSUPPORTED_OBJECT_DOMAINS = frozenset({"Stage"})
+_UNSUPPORTED_OBJECT_KEYS = ("locations",)
+
+
 class PermissiveModel(pydantic.BaseModel):
     class Config:
         extra = "allow"
@@ -106,6 +110,13 @@ class SnowflakeJoinedAccessEvent(PermissiveModel):
     role_name: str
 
 
+# The result columns of SnowflakeQuery.operational_data_for_time_window, paired
+# with the SnowflakeJoinedAccessEvent field that each one populates.
+_OPERATION_EVENT_COLUMNS = tuple(
+    (field.upper(), field) for field in SnowflakeJoinedAccessEvent.__fields__
+)
+
+
 class SnowflakeUsageExtractor(
     SnowflakeQueryMixin, SnowflakeConnectionMixin, SnowflakeCommonMixin
 ):
@@ -122,6 +133,10 @@ class SnowflakeUsageExtractor(
         self.logger = logger
         self.connection: Optional[SnowflakeConnection] = None
 
+        # Map of (user name, email) -> user urn. There are far fewer distinct
+        # users than access history rows.
+        self._user_urns: Dict[Tuple[str, Optional[str]], str] = {}
+
         self.redundant_run_skip_handler = redundant_run_skip_handler
         self.start_time, self.end_time = (
             self.report.usage_start_time,
@@ -259,14 +274,14 @@ class SnowflakeUsageExtractor(
                 totalSqlQueries=row["TOTAL_QUERIES"],
                 uniqueUserCount=row["TOTAL_USERS"],
                 topSqlQueries=self._map_top_sql_queries(
-                    json.loads(row["TOP_SQL_QUERIES"])
+                    orjson.loads(row["TOP_SQL_QUERIES"])
                 )
                 if self.config.include_top_n_queries
                 else None,
                 userCounts=self._map_user_counts(
-                    json.loads(row["USER_COUNTS"]),
+                    orjson.loads(row["USER_COUNTS"]),
                 ),
-                fieldCounts=self._map_field_counts(json.loads(row["FIELD_COUNTS"])),
+                fieldCounts=self._map_field_counts(orjson.loads(row["FIELD_COUNTS"])),
             )
 
             yield MetadataChangeProposalWrapper(
@@ -310,13 +325,7 @@ class SnowflakeUsageExtractor(
 
             filtered_user_counts.append(
                 DatasetUserUsageCounts(
-                    user=make_user_urn(
-                        self.get_user_identifier(
-                            user_count["user_name"],
-                            user_email,
-                            self.config.email_as_user_identifier,
-                        )
-                    ),
+                    user=self._get_user_urn(user_count["user_name"], user_email),
                     count=user_count["total"],
                     # NOTE: Generated emails may be incorrect, as email may be different than
                     # username@email_domain
@@ -325,11 +334,24 @@ class SnowflakeUsageExtractor(
             )
         return sorted(filtered_user_counts, key=lambda v: v.user)
 
+    def _get_user_urn(self, user_name: str, user_email: Optional[str]) -> str:
+        key = (user_name, user_email)
+        user_urn = self._user_urns.get(key)
+        if user_urn is None:
+            user_urn = make_user_urn(
+                self.get_user_identifier(
+                    user_name, user_email, self.config.email_as_user_identifier
+                )
+            )
+            self._user_urns[key] = user_urn
+        return user_urn
+
     def _map_field_counts(self, field_counts: Dict) -> List[DatasetFieldUsageCounts]:
+        snowflake_identifier = self.snowflake_identifier
         return sorted(
             [
                 DatasetFieldUsageCounts(
-                    fieldPath=self.snowflake_identifier(field_count["col"]),
+                    fieldPath=snowflake_identifier(field_count["col"]),
                     count=field_count["total"],
                 )
                 for field_count in field_counts
@@ -413,11 +435,7 @@ class SnowflakeUsageExtractor(
             )
             reported_time: int = int(time.time() * 1000)
             last_updated_timestamp: int = int(start_time.timestamp() * 1000)
-            user_urn = make_user_urn(
-                self.get_user_identifier(
-                    user_name, user_email, self.config.email_as_user_identifier
-                )
-            )
+            user_urn = self._get_user_urn(user_name, user_email)
 
             # NOTE: In earlier `snowflake-usage` connector this was base_objects_accessed, which is incorrect
             for obj in event.objects_modified:
@@ -463,8 +481,13 @@ class SnowflakeUsageExtractor(
                 self.report.rows_missing_query_text += 1
                 return
             self.parse_event_objects(event_dict)
+            # The columns are fixed by operational_data_for_time_window, so read
+            # them directly instead of re-keying the whole row.
             event = SnowflakeJoinedAccessEvent(
-                **{k.lower(): v for k, v in event_dict.items()}
+                **{
+                    field: event_dict[column]
+                    for column, field in _OPERATION_EVENT_COLUMNS
+                }
             )
             yield event
         except Exception as e:
@@ -477,7 +500,7 @@ class SnowflakeUsageExtractor(
     def parse_event_objects(self, event_dict: Dict) -> None:
         event_dict["BASE_OBJECTS_ACCESSED"] = [
             obj
-            for obj in json.loads(event_dict["BASE_OBJECTS_ACCESSED"])
+            for obj in orjson.loads(event_dict["BASE_OBJECTS_ACCESSED"])
             if self._is_object_valid(obj)
         ]
         if len(event_dict["BASE_OBJECTS_ACCESSED"]) == 0:
@@ -485,7 +508,7 @@ class SnowflakeUsageExtractor(
 
         event_dict["DIRECT_OBJECTS_ACCESSED"] = [
             obj
-            for obj in json.loads(event_dict["DIRECT_OBJECTS_ACCESSED"])
+            for obj in orjson.loads(event_dict["DIRECT_OBJECTS_ACCESSED"])
             if self._is_object_valid(obj)
         ]
         if len(event_dict["DIRECT_OBJECTS_ACCESSED"]) == 0:
@@ -493,15 +516,17 @@ class SnowflakeUsageExtractor(
 
         event_dict["OBJECTS_MODIFIED"] = [
             obj
-            for obj in json.loads(event_dict["OBJECTS_MODIFIED"])
+            for obj in orjson.loads(event_dict["OBJECTS_MODIFIED"])
             if self._is_object_valid(obj)
         ]
         if len(event_dict["OBJECTS_MODIFIED"]) == 0:
             self.report.rows_zero_objects_modified += 1
 
-        event_dict["QUERY_START_TIME"] = (event_dict["QUERY_START_TIME"]).astimezone(
-            tz=timezone.utc
-        )
+        # The query already converts the start time to UTC.
+        if event_dict["QUERY_START_TIME"].tzinfo is None:
+            event_dict["QUERY_START_TIME"] = event_dict["QUERY_START_TIME"].replace(
+                tzinfo=timezone.utc
+            )
 
         if (
             not event_dict["EMAIL"]
@@ -518,12 +543,10 @@ class SnowflakeUsageExtractor(
             self.report.rows_missing_email += 1
 
     def _is_unsupported_object_accessed(self, obj: Dict[str, Any]) -> bool:
-        unsupported_keys = ["locations"]
-
-        if obj.get("objectDomain") in ["Stage"]:
+        if obj.get("objectDomain") in _UNSUPPORTED_OBJECT_DOMAINS:
             return True
 
-        return any([obj.get(key) is not None for key in unsupported_keys])
+        return any(obj.get(key) is not None for key in _UNSUPPORTED_OBJECT_KEYS)
 
     def _is_object_valid(self, obj: Dict[str, Any]) -> bool:
         if self._is_unsupported_object_accessed(
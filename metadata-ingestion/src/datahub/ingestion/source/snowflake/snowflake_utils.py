@@ -18,6 +18,16 @@ from datahub.ingestion.source.snowflake.snowflake_report import SnowflakeV2Repor
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Object domains that we ingest as datasets.
+_DATASET_OBJECT_DOMAINS = frozenset(
+    {
+        SnowflakeObjectDomain.TABLE,
+        SnowflakeObjectDomain.EXTERNAL_TABLE,
+        SnowflakeObjectDomain.VIEW,
+        SnowflakeObjectDomain.MATERIALIZED_VIEW,
+    }
+)
+
 
 class SnowflakePermissionError(MetaError):
     """A permission error has happened"""
@@ -38,6 +48,9 @@ class SnowflakeQueryMixin:
     def query(self: SnowflakeQueryProtocol, query: str) -> Any:
         try:
             self.logger.debug("Query : {}".format(query))
+            # The cursor is returned as-is so that callers can stream the rows.
+            # The connector downloads result chunks lazily, in the background
+            # (see CLIENT_PREFETCH_THREADS), so iterating it keeps memory bounded.
             resp = self.get_connection().cursor(DictCursor).execute(query)
             return resp
 
@@ -129,14 +142,9 @@ class SnowflakeCommonMixin:
             return True
         if not dataset_type or not dataset_name:
             return True
-        dataset_params = dataset_name.split(".")
-        if dataset_type.lower() not in (
-            SnowflakeObjectDomain.TABLE,
-            SnowflakeObjectDomain.EXTERNAL_TABLE,
-            SnowflakeObjectDomain.VIEW,
-            SnowflakeObjectDomain.MATERIALIZED_VIEW,
-        ):
+        if dataset_type.lower() not in _DATASET_OBJECT_DOMAINS:
             return False
+        dataset_params = dataset_name.split(".")
         if len(dataset_params) != 3:
             self.report_warning(
                 "invalid-dataset-pattern",
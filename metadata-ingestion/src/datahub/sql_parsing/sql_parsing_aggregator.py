@@ -1,6 +1,7 @@
 import contextlib
 import dataclasses
 import enum
+import functools
 import itertools
 import json
 import logging
@@ -69,6 +70,20 @@ _DEFAULT_QUERY_LOG_SETTING = QueryLogSetting[
     os.getenv("DATAHUB_SQL_AGG_QUERY_LOG") or QueryLogSetting.DISABLED.name
 ]
 
+# Warehouses frequently report the same query text many times, e.g. for
+# scheduled jobs, and fingerprinting or formatting it requires a full parse.
+_QUERY_CACHE_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _get_query_fingerprint(query: str, platform: str) -> str:
+    return get_query_fingerprint(query, platform=platform)
+
+
+@functools.lru_cache(maxsize=_QUERY_CACHE_SIZE)
+def _format_query(query: str, platform: str) -> str:
+    return try_format_query(query, platform)
+
 
 @dataclasses.dataclass
 class LoggedQuery:
@@ -376,7 +391,7 @@ class SqlParsingAggregator(Closeable):
 
     def _maybe_format_query(self, query: str) -> str:
         if self.format_queries:
-            return try_format_query(query, self.platform.platform_name)
+            return _format_query(query, self.platform.platform_name)
         return query
 
     def add_known_query_lineage(
@@ -400,7 +415,7 @@ class SqlParsingAggregator(Closeable):
         self.report.num_known_query_lineage += 1
 
         # Generate a fingerprint for the query.
-        query_fingerprint = get_query_fingerprint(
+        query_fingerprint = _get_query_fingerprint(
             known_query_lineage.query_text, platform=self.platform.platform_name
         )
         formatted_query = self._maybe_format_query(known_query_lineage.query_text)
@@ -121,7 +121,21 @@ class ConnectionWrapper:
         self, sql: str, parameters: Union[Dict[str, Any], Sequence[Any]] = ()
     ) -> sqlite3.Cursor:
         with self.conn_lock:
-            return self.conn.executemany(sql, parameters)
+            if self.conn.in_transaction:
+                return self.conn.executemany(sql, parameters)
+
+            # Since the connection is in autocommit mode, each row would otherwise
+            # be written in its own transaction.
+            self.conn.execute("BEGIN")
+            try:
+                cursor = self.conn.executemany(sql, parameters)
+            except BaseException:
+                # SQLite rolls back by itself on some errors, e.g. SQLITE_FULL.
+                if self.conn.in_transaction:
+                    self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            return cursor
 
     def close(self) -> None:
         for obj in self._dependent_objects:
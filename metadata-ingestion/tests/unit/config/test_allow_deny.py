@@ -49,3 +49,19 @@ def test_case_sensitivity():
     pattern = AllowDenyPattern(allow=["Foo.myTable"], ignoreCase=False)
     assert not pattern.allowed("foo.mytable")
     assert pattern.allowed("Foo.myTable")
+
+
+def test_allowed_after_mutation():
+    pattern = AllowDenyPattern(allow=["foo.*"])
+    assert pattern.allowed("foo.mytable")
+
+    pattern.deny.append(".*mytable")
+    assert not pattern.allowed("foo.mytable")
+    assert pattern.allowed("foo.othertable")
+
+
+def test_allowed_stops_at_first_match():
+    # Patterns after the first match are never compiled, so an invalid one there
+    # does not cause an error.
+    pattern = AllowDenyPattern(allow=[".*", "[bad"])
+    assert pattern.allowed("foo.mytable")
@@ -12,6 +12,7 @@ from datahub.sql_parsing.sql_parsing_aggregator import (
 )
 from datahub.sql_parsing.sql_parsing_common import QueryType
 from datahub.sql_parsing.sqlglot_lineage import ColumnLineageInfo, ColumnRef
+from datahub.sql_parsing.sqlglot_utils import get_query_fingerprint, try_format_query
 from tests.test_helpers import mce_helpers
 from tests.test_helpers.click_helpers import run_datahub_cmd
 
@@ -459,6 +460,41 @@ def test_add_known_query_lineage(pytestconfig: pytest.Config) -> None:
     )
 
 
+def test_add_known_query_lineage_repeated_query() -> None:
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+        format_queries=True,
+    )
+
+    query_text = "insert into foo (a) select a from bar union select a from baz"
+    downstream_urn = DatasetUrn("redshift", "dev.public.foo").urn()
+    for upstream, ts in [("bar", 20), ("baz", 25)]:
+        aggregator.add_known_query_lineage(
+            KnownQueryLineageInfo(
+                query_text=query_text,
+                downstream=downstream_urn,
+                upstreams=[DatasetUrn("redshift", f"dev.public.{upstream}").urn()],
+                timestamp=_ts(ts),
+                query_type=QueryType.INSERT,
+            ),
+            merge_lineage=True,
+        )
+
+    assert len(aggregator._query_map) == 1
+    query_fingerprint = get_query_fingerprint(query_text, platform="redshift")
+    query = aggregator._query_map[query_fingerprint]
+    assert query.query_id == query_fingerprint
+    assert query.formatted_query_string == try_format_query(query_text, "redshift")
+    assert query.latest_timestamp == _ts(25)
+    assert sorted(query.upstreams) == sorted(
+        DatasetUrn("redshift", f"dev.public.{upstream}").urn()
+        for upstream in ["bar", "baz"]
+    )
+
+
 @freeze_time(FROZEN_TIME)
 def test_table_rename(pytestconfig: pytest.Config) -> None:
     aggregator = SqlParsingAggregator(
@@ -1,3 +1,4 @@
+import re
 from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
@@ -17,11 +18,17 @@ from datahub.ingestion.source.snowflake.snowflake_config import (
     DEFAULT_TABLES_DENY_LIST,
     SnowflakeV2Config,
 )
+from datahub.ingestion.source.snowflake.snowflake_lineage_v2 import (
+    _LINEAGE_PARSE_BATCH_SIZE,
+    _get_lineage_parse_workers,
+    _parse_upstream_lineage_rows_in_parallel,
+)
 from datahub.ingestion.source.snowflake.snowflake_query import (
     SnowflakeQuery,
     create_deny_regex_sql_filter,
 )
 from datahub.ingestion.source.snowflake.snowflake_usage_v2 import (
+    _OPERATION_EVENT_COLUMNS,
     SnowflakeObjectAccessEntry,
 )
 from datahub.ingestion.source.snowflake.snowflake_utils import SnowflakeCommonMixin
@@ -534,6 +541,65 @@ def test_snowflake_query_create_deny_regex_sql():
     )
 
 
+@pytest.mark.parametrize("include_view_lineage", [True, False])
+def test_snowflake_column_upstreams_domain_filter(include_view_lineage):
+    query = SnowflakeQuery.table_upstreams_with_column_lineage(
+        start_time_millis=0,
+        end_time_millis=1,
+        upstreams_deny_pattern=[],
+        include_view_lineage=include_view_lineage,
+    )
+    # Column upstreams are always filtered to every dataset domain, independent
+    # of the table-level domain filter controlled by include_view_lineage.
+    assert (
+        "upstream_column_object_domain::varchar in "
+        f"{SnowflakeQuery.ACCESS_HISTORY_TABLE_VIEW_DOMAINS_FILTER}" in query
+    )
+    for domain in ("'External table'", "'Materialized view'"):
+        assert domain in SnowflakeQuery.ACCESS_HISTORY_TABLE_VIEW_DOMAINS_FILTER
+
+
+def _upstream_lineage_row(i: int) -> Dict[str, Any]:
+    return {
+        "DOWNSTREAM_TABLE_NAME": f"db.schema.table_{i}",
+        "DOWNSTREAM_TABLE_DOMAIN": "Table",
+        "UPSTREAM_TABLES": '[{"upstream_object_domain": "Table", '
+        '"upstream_object_name": "db.schema.upstream", "query_id": "q"}]',
+        "UPSTREAM_COLUMNS": None,
+        "QUERIES": None,
+    }
+
+
+def test_snowflake_parse_upstream_lineage_rows_in_parallel():
+    num_rows = 2 * _LINEAGE_PARSE_BATCH_SIZE + 7
+    rows = (_upstream_lineage_row(i) for i in range(num_rows))
+
+    edges = list(_parse_upstream_lineage_rows_in_parallel(rows, max_workers=2))
+
+    assert [edge.DOWNSTREAM_TABLE_NAME for edge in edges] == [
+        f"db.schema.table_{i}" for i in range(num_rows)
+    ]
+    assert edges[0].UPSTREAM_TABLES
+    assert edges[0].UPSTREAM_TABLES[0].upstream_object_name == "db.schema.upstream"
+
+
+def test_snowflake_parse_upstream_lineage_rows_in_parallel_error():
+    rows = [_upstream_lineage_row(i) for i in range(_LINEAGE_PARSE_BATCH_SIZE + 1)]
+    del rows[-1]["DOWNSTREAM_TABLE_NAME"]
+
+    with pytest.raises(ValidationError):
+        list(_parse_upstream_lineage_rows_in_parallel(rows, max_workers=2))
+
+
+@pytest.mark.parametrize("value, expected", [(None, 0), ("", 0), ("4", 4), ("four", 0)])
+def test_snowflake_lineage_parse_workers_env(monkeypatch, value, expected):
+    if value is None:
+        monkeypatch.delenv("DATAHUB_SNOWFLAKE_LINEAGE_PARSE_WORKERS", raising=False)
+    else:
+        monkeypatch.setenv("DATAHUB_SNOWFLAKE_LINEAGE_PARSE_WORKERS", value)
+    assert _get_lineage_parse_workers() == expected
+
+
 def test_snowflake_temporary_patterns_config_rename():
     conf = SnowflakeV2Config.parse_obj(
         {
@@ -546,6 +612,15 @@ def test_snowflake_temporary_patterns_config_rename():
     assert conf.temporary_tables_pattern == [".*tmp.*"]
 
 
+def test_snowflake_operation_event_columns_match_query():
+    query = SnowflakeQuery.operational_data_for_time_window(0, 1)
+    selected_columns = re.findall(r'AS "(\w+)"', query)
+
+    assert sorted(selected_columns) == sorted(
+        column for column, _ in _OPERATION_EVENT_COLUMNS
+    )
+
+
 def test_email_filter_query_generation_with_one_deny():
     email_filter = AllowDenyPattern(deny=[".*@example.com"])
     filter_query = SnowflakeQuery.gen_email_filter_query(email_filter)
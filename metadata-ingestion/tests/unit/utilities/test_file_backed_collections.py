@@ -303,6 +303,37 @@ def test_shared_connection() -> None:
         assert list(cur)[0][0] == 3
 
 
+def test_executemany_rolls_back_on_error() -> None:
+    with ConnectionWrapper() as connection:
+        connection.execute("CREATE TABLE items (key TEXT PRIMARY KEY)")
+
+        # The duplicate key fails partway through the batch.
+        with pytest.raises(sqlite3.IntegrityError):
+            connection.executemany(
+                "INSERT INTO items VALUES (?)", [("a",), ("b",), ("a",), ("c",)]
+            )
+        assert not connection.conn.in_transaction
+        assert list(connection.execute("SELECT COUNT(*) FROM items"))[0][0] == 0
+
+        connection.executemany("INSERT INTO items VALUES (?)", [("a",), ("b",)])
+        assert not connection.conn.in_transaction
+        assert list(connection.execute("SELECT COUNT(*) FROM items"))[0][0] == 2
+
+    with ConnectionWrapper() as connection:
+        connection.execute("CREATE TABLE items (key TEXT PRIMARY KEY, value BLOB)")
+
+        # SQLite rolls the transaction back by itself once the database is full,
+        # and that original error should be the one that surfaces.
+        connection.execute("PRAGMA max_page_count = 20")
+        with pytest.raises(sqlite3.OperationalError, match="full"):
+            connection.executemany(
+                "INSERT INTO items VALUES (?, ?)",
+                [(str(i), b"x" * 4000) for i in range(100)],
+            )
+        assert not connection.conn.in_transaction
+        assert list(connection.execute("SELECT COUNT(*) FROM items"))[0][0] == 0
+
+
 def test_file_list() -> None:
     my_list = FileBackedList[int](
         serializer=lambda x: x,